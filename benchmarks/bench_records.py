@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# Measures memory per record and bulk parse throughput for Creepyr's instance and account records
+
+
+import gc
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import creepyr
+
+
+def make_instance_dicts(count: int) -> list[dict]:
+    return [{
+            "name": f"instance-{i}",
+            "mcdir": f"~/.creepyr/instances/instance-{i}",
+            "mcversion": "1.20.1",
+            "mctype": "fabric",
+            "mlversion": "0.15.0",
+            "jvmexec": "/usr/lib/jvm/default/bin/java",
+            "jvmargs": ["-Xmx4G", "-Xms1G"],
+            "verify_mcversion": True,
+            "verify_mlversion": True,
+            "verify_launch_version": True,
+            "cf_manifest_path": None,
+            "mr_manifest_path": None,
+            "creepyr_manifest_path": f"~/.creepyr/instances/instance-{i}.json",
+            } for i in range(count)]
+
+def make_account_dicts(count: int) -> list[dict]:
+    return [{"name": f"account-{i}", "username": f"player{i}", "mcuuid": f"{i:032x}", "mctoken": ""} for i in range(count)]
+
+class DictRecord():
+    # Stand-in for the old __dict__-backed Instance/Account, with the same fields
+    def __init__(self, record: dict) -> None:
+        for field, value in record.items():
+            setattr(self, field, list(value) if isinstance(value, list) else value)
+
+def build_dict_records(records: list[dict]) -> list:
+    return [DictRecord(record) for record in records]
+
+def measure(data: bytes, build) -> tuple[list, float, int]:
+    # Trace from before the parse, so the field strings count towards the records that keep them alive
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+    records = creepyr.loads_records(data)
+    objs = build(records)
+    build_time = perf_counter() - start
+    del records
+    gc.collect()
+    mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objs, build_time, mem
+
+def bench(kind: str, cls, dicts: list[dict]) -> None:
+    count = len(dicts)
+    data = creepyr.dumps_records(dicts)
+    start = perf_counter()
+    creepyr.loads_records(data)
+    parse_time = perf_counter() - start
+    objs, build_time, mem = measure(data, cls.from_dicts)
+    _, _, dict_mem = measure(data, build_dict_records)
+    start = perf_counter()
+    creepyr.dumps_records(cls.to_dicts(objs))
+    dump_time = perf_counter() - start
+    print(f"{kind}: {count} records, {len(data)} bytes")
+    print(f"    parse:   {count / parse_time:,.0f} records/s")
+    print(f"    load:    {count / build_time:,.0f} records/s (parse and build)")
+    print(f"    memory:  {mem / count:,.0f} bytes/record slotted, {dict_mem / count:,.0f} bytes/record with __dict__")
+    print(f"    dump:    {count / dump_time:,.0f} records/s")
+
+
+def main(args: list[str]) -> int:
+    count = int(args[1]) if len(args) > 1 else 10000
+    backend = "orjson" if creepyr.orjson is not None else "msgspec" if creepyr.msgspec is not None else "json"
+    print(f"Codec backend: {backend}")
+    bench("Instance", creepyr.Instance, make_instance_dicts(count))
+    bench("Account", creepyr.Account, make_account_dicts(count))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main(sys.argv))
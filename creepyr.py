@@ -34,19 +34,49 @@ import subprocess
 import sys
 import os
 import socket
+import re
+import gzip
+import shutil
+import zipfile
+import hashlib
+import tempfile
+import struct
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import requests
-from logging import getLogger
-from typing import Union
+import requests.sessions
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from email.utils import parsedate_to_datetime
+from contextlib import contextmanager, nullcontext
+from logging import getLogger, Logger, Formatter, INFO
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from collections import deque, OrderedDict
+from queue import Queue, Full, Empty
+from time import time, time_ns, monotonic, sleep
+from typing import Callable, Sequence, Union
 from json import dumps as jdumps, loads as jloads
-from threading import Thread
+from threading import Thread, Condition, Event, Lock, local as thread_local, current_thread
 from uuid import uuid1 as randuuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 logger = getLogger("creepyr")
 
 global cf_api_key
 cf_api_key: str = ""
 
+global delta_mirror_url
+delta_mirror_url: Union[str, None] = None
+
 
 def expand_full_path(pathstr: str) -> str:
     return os.path.expanduser(os.path.expandvars(pathstr))
@@ -55,7 +85,804 @@ def has_network_access() -> bool:
     return not socket.gethostbyname(socket.gethostname()).startswith(("127.", "172."))
 
 
+def dumps_records(records: list[dict]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(records)
+    if msgspec is not None:
+        return msgspec.json.encode(records)
+    return jdumps(records, separators=(",", ":")).encode("utf-8")
+
+def loads_records(data: Union[bytes, str]) -> list[dict]:
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return jloads(data)
+
+def validate_record(data: dict, fields: dict, kind: str) -> dict:
+    record = {}
+    for field, (ftypes, default) in fields.items():
+        value = data.get(field, default)
+        if not isinstance(value, ftypes):
+            logger.warning(f"Invalid {kind} field {field}: {value!r}    ; Using default: {default!r}")
+            value = default
+        record[field] = value
+    return record
+
+def split_jvmargs(jvmargs: Union[Sequence[str], str]) -> list[str]:
+    if isinstance(jvmargs, str):
+        return [arg for arg in jvmargs.split(" ") if arg != ""]
+    return [str(arg) for arg in jvmargs]
+
+
+class LogCompressor():
+    def __init__(self) -> None:
+        self.queue: Queue = Queue()
+        self.lock: Lock = Lock()
+        self.thread: Union[Thread, None] = None
+
+    def submit(self, rawpath: str, basepath: str, backup_count: int) -> None:
+        with self.lock:
+            self.queue.put((rawpath, basepath, backup_count))
+            if self.thread is None:
+                # Not a daemon, so pending logs still get compressed before the process exits
+                self.thread = Thread(target=self._run, name="creepyr-log-compressor")
+                self.thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                rawpath, basepath, backup_count = self.queue.get(timeout=1)
+            except Empty:
+                with self.lock:
+                    if self.queue.empty():
+                        self.thread = None
+                        return
+                continue
+            try:
+                self.compress(rawpath)
+                self.prune(basepath, backup_count)
+            except Exception as e:
+                logger.warning(f"Could not compress log file {rawpath}: {e}")
+
+    @staticmethod
+    def compress(rawpath: str) -> None:
+        with open(rawpath, "rb") as sf, gzip.open(rawpath + ".gz.tmp", "wb") as df:
+            shutil.copyfileobj(sf, df)
+        os.replace(rawpath + ".gz.tmp", rawpath + ".gz")
+        os.remove(rawpath)
+
+    @staticmethod
+    def prune(basepath: str, backup_count: int) -> None:
+        logdir, basename = os.path.split(basepath)
+        archives = sorted(filename for filename in os.listdir(logdir) if filename.startswith(basename + ".") and filename.endswith(".gz"))
+        for filename in archives[:max(0, len(archives) - backup_count)]:
+            os.remove(os.path.join(logdir, filename))
+
+log_compressor = LogCompressor()
+
+
+class LogPipeline():
+    tick_lag_pattern = re.compile(r"Can't keep up!.*?Running (\d+)ms or (\d+) ticks behind")
+    crash_report_pattern = re.compile(r"(?:This crash report has been saved to|Crash report saved to):?\s*(?:#@!@#\s*)?(\S.*)$")
+    crash_pattern = re.compile(r"(---- Minecraft Crash Report ----|A fatal error has been detected by the Java Runtime Environment|Exception in thread \"(?:main|Server thread|Render thread)\")")
+
+    def __init__(self, name: str, log_dir: str, max_bytes: int = 10*1024*1024, backup_count: int = 10, when: Union[str, None] = None, echo: bool = True, echo_queue_size: int = 10000, max_events: int = 1000, on_event: Union[Callable[[dict], None], None] = None) -> None:
+        self.name: str = name
+        self.log_dir: str = expand_full_path(log_dir)
+        self.max_bytes: int = max_bytes
+        self.backup_count: int = backup_count
+        self.when: Union[str, None] = when
+        self.echo: bool = echo
+        self.echo_queue: Queue = Queue(maxsize=echo_queue_size)
+        self.echo_dropped: int = 0
+        self.read_done: Event = Event()
+        self.events: deque = deque(maxlen=max_events)
+        self.on_event: Union[Callable[[dict], None], None] = on_event
+        self.reader_thread: Union[Thread, None] = None
+        self.echo_thread: Union[Thread, None] = None
+        self.handler = None
+        self.game_logger: Union[Logger, None] = None
+
+    def get_log_path(self) -> str:
+        return os.path.join(self.log_dir, f"{self.name}.log")
+
+    def open(self) -> None:
+        os.makedirs(self.log_dir, exist_ok=True)
+        if self.when is not None:
+            self.handler = TimedRotatingFileHandler(self.get_log_path(), when=self.when, backupCount=self.backup_count, encoding="utf-8")
+        else:
+            self.handler = RotatingFileHandler(self.get_log_path(), maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8")
+        self.handler.rotator = self.rotate
+        self.handler.setFormatter(Formatter("%(message)s"))
+        # Not registered with the logging manager, so each pipeline owns its handler
+        self.game_logger = Logger(f"creepyr.game.{self.name}", INFO)
+        self.game_logger.propagate = False
+        self.game_logger.addHandler(self.handler)
+
+    def rotate(self, source: str, dest: str) -> None:
+        # Runs on the reader thread, so only rename here and leave the gzip to the compressor thread.
+        # Timestamped names keep the handler's own numbered shifting away from files still being compressed.
+        rawpath = f"{source}.{time_ns()}"
+        os.rename(source, rawpath)
+        log_compressor.submit(rawpath, source, self.backup_count)
+
+    def close(self) -> None:
+        if self.game_logger is not None and self.handler is not None:
+            self.game_logger.removeHandler(self.handler)
+            self.handler.close()
+        self.handler = None
+        self.game_logger = None
+
+    def parse_line(self, line: str) -> Union[dict, None]:
+        match = self.tick_lag_pattern.search(line)
+        if match is not None:
+            return {"type": "tick_lag", "instance": self.name, "time": time(), "ms": int(match.group(1)), "ticks": int(match.group(2)), "line": line}
+        match = self.crash_report_pattern.search(line)
+        if match is not None:
+            return {"type": "crash", "instance": self.name, "time": time(), "report_path": match.group(1).strip(), "line": line}
+        if self.crash_pattern.search(line) is not None:
+            return {"type": "crash", "instance": self.name, "time": time(), "report_path": None, "line": line}
+        return None
+
+    def emit_event(self, event: dict) -> None:
+        self.events.append(event)
+        if event["type"] == "crash":
+            logger.error(f"Instance {self.name} crashed: {event['line']}")
+        else:
+            logger.warning(f"Instance {self.name} is {event['ms']}ms or {event['ticks']} ticks behind")
+        if self.on_event is not None:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                logger.warning(f"Encountered exception in log event callback for instance {self.name}: {e}")
+
+    def handle_line(self, line: str) -> None:
+        if self.game_logger is not None:
+            self.game_logger.info(line)
+        event = self.parse_line(line)
+        if event is not None:
+            self.emit_event(event)
+        if self.echo:
+            try:
+                self.echo_queue.put_nowait(line)
+            except Full:
+                # A slow console must never back up into the game's stdout pipe
+                self.echo_dropped += 1
+
+    def _read(self, stream) -> None:
+        try:
+            for rawline in iter(stream.readline, b""):
+                self.handle_line(rawline.decode("utf-8", errors="replace").rstrip("\r\n"))
+        finally:
+            stream.close()
+            self.read_done.set()
+
+    def _echo(self) -> None:
+        while True:
+            try:
+                line = self.echo_queue.get(timeout=0.1)
+            except Empty:
+                # Nothing is queued after read_done is set, so an empty queue then means all lines were seen
+                if self.read_done.is_set() and self.echo_queue.empty():
+                    break
+                continue
+            if not self.echo:
+                continue
+            try:
+                print(line)
+            except Exception as e:
+                # A closed or non-UTF-8 console must not stop the game output from being drained
+                self.echo = False
+                logger.warning(f"Stopped echoing instance {self.name} to the console: {e}")
+        if self.echo_dropped > 0:
+            logger.warning(f"Dropped {self.echo_dropped} console lines from instance {self.name}; see {self.get_log_path()} for the full log")
+
+    def attach(self, proc: subprocess.Popen) -> None:
+        if self.game_logger is None:
+            self.open()
+        if self.echo:
+            self.echo_thread = Thread(target=self._echo, name=f"creepyr-echo-{self.name}", daemon=True)
+            self.echo_thread.start()
+        self.reader_thread = Thread(target=self._read, args=[proc.stdout], name=f"creepyr-log-{self.name}", daemon=True)
+        self.reader_thread.start()
+
+    def wait(self, proc: subprocess.Popen) -> int:
+        try:
+            exit_code = proc.wait()
+        except BaseException:
+            # Match subprocess.call, which kills and reaps the child if waiting is interrupted
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            try:
+                if self.reader_thread is not None:
+                    self.reader_thread.join()
+                if self.echo_thread is not None:
+                    self.echo_thread.join()
+            finally:
+                self.close()
+        return exit_code
+
+    def run(self, cmd: list[str], cwd: Union[str, None] = None) -> int:
+        proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        self.attach(proc)
+        return self.wait(proc)
+
+
+class VersionIndex():
+    index_filename: str = "creepyr_versions.json"
+    index_format: int = 2
+
+    def __init__(self, mcdir: str) -> None:
+        self.mcdir: str = expand_full_path(mcdir)
+        self.versions: dict = {}
+
+    def get_index_path(self) -> str:
+        return os.path.join(self.mcdir, self.index_filename)
+
+    def get_versions_dir(self) -> str:
+        return os.path.join(self.mcdir, "versions")
+
+    def get_version_json_path(self, version: str) -> str:
+        return os.path.join(self.get_versions_dir(), version, f"{version}.json")
+
+    def read_version(self, version: str, mtime: float) -> Union[dict, None]:
+        try:
+            with open(self.get_version_json_path(version), "r") as f:
+                data = jloads(f.read())
+        except Exception as e:
+            logger.warning(f"Could not read version file for {version}: {e}")
+            return None
+        return {
+                "id": data.get("id", version),
+                "type": data.get("type", ""),
+                "inheritsFrom": data.get("inheritsFrom"),
+                "mtime": mtime,
+                }
+
+    def rebuild(self) -> bool:
+        versions_dir = self.get_versions_dir()
+        old_versions = self.versions
+        self.versions = {}
+        if os.path.isdir(versions_dir):
+            for version in os.listdir(versions_dir):
+                jfilepath = self.get_version_json_path(version)
+                try:
+                    mtime = os.path.getmtime(jfilepath)
+                except OSError:
+                    continue
+                old_entry = old_versions.get(version)
+                if old_entry is not None and old_entry.get("mtime") == mtime:
+                    # Unchanged since the last scan, no need to parse it again
+                    self.versions[version] = old_entry
+                else:
+                    entry = self.read_version(version, mtime)
+                    if entry is not None:
+                        self.versions[version] = entry
+        return self.save()
+
+    def load(self) -> bool:
+        jfilepath = self.get_index_path()
+        if os.path.isfile(jfilepath):
+            try:
+                with open(jfilepath, "r") as f:
+                    data = jloads(f.read())
+                if data.get("format") == self.index_format:
+                    self.versions = data.get("versions", {})
+                    return True
+            except Exception as e:
+                logger.warning(f"Could not load version index {jfilepath}: {e}")
+        return False
+
+    def save(self) -> bool:
+        jfilepath = self.get_index_path()
+        try:
+            os.makedirs(self.mcdir, exist_ok=True)
+            # A unique temp file per writer, since several launchers can share one mcdir
+            fd, tmppath = tempfile.mkstemp(prefix=self.index_filename + ".", suffix=".tmp", dir=self.mcdir)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(jdumps({"format": self.index_format, "versions": self.versions}))
+                os.replace(tmppath, jfilepath)
+            finally:
+                if os.path.isfile(tmppath):
+                    os.remove(tmppath)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save version index {jfilepath}: {e}")
+            return False
+
+    def has_version(self, version: str) -> bool:
+        if version not in self.versions:
+            return False
+        # A stat is enough to catch versions deleted since the last scan
+        if not os.path.isfile(self.get_version_json_path(version)):
+            del self.versions[version]
+            self.save()
+            return False
+        return True
+
+    def has_versions(self) -> bool:
+        for version in list(self.versions):
+            if self.has_version(version):
+                return True
+        self.rebuild()
+        return len(self) > 0
+
+    def get_inheritance_chain(self, version: str) -> list[str]:
+        chain = []
+        while version is not None and version not in chain:
+            chain.append(version)
+            version = self.versions[version].get("inheritsFrom") if version in self.versions else None
+        return chain
+
+    def is_launchable(self, version: str) -> bool:
+        return all(self.has_version(chain_version) for chain_version in self.get_inheritance_chain(version))
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    @staticmethod
+    def open(mcdir: str):
+        index = VersionIndex(mcdir)
+        if not index.load() or len(index) == 0:
+            index.rebuild()
+        return index
+
+
+class FairTokenBucket():
+    def __init__(self, rate: float, burst: Union[float, None] = None) -> None:
+        self.rate: float = rate
+        self.scale: float = 1.0
+        self.burst: float = burst if burst is not None else max(rate, 1.0)
+        self.tokens: float = self.burst
+        self.updated: float = monotonic()
+        self.condition: Condition = Condition()
+        self.waiting: OrderedDict = OrderedDict()
+
+    def get_rate(self) -> float:
+        return self.rate * self.scale
+
+    def set_rate(self, rate: float) -> None:
+        with self.condition:
+            self.rate = rate
+            self.burst = max(rate, 1.0)
+            self.tokens = 0
+            self.updated = monotonic()
+            self.condition.notify_all()
+
+    def refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.get_rate())
+        self.updated = now
+
+    def is_turn(self, owner: str, ticket: object) -> bool:
+        # Owners take turns, so one instance with a long queue cannot starve the others
+        first_owner = next(iter(self.waiting))
+        return first_owner == owner and self.waiting[owner][0] is ticket
+
+    def acquire(self, amount: float, owner: str) -> None:
+        if self.rate <= 0:
+            return
+        ticket = object()
+        with self.condition:
+            self.waiting.setdefault(owner, deque()).append(ticket)
+            while True:
+                timeout = None
+                if self.is_turn(owner, ticket):
+                    self.refill()
+                    # Requests larger than the burst go into debt instead of waiting forever
+                    needed = min(amount, self.burst)
+                    if self.tokens >= needed:
+                        self.tokens -= amount
+                        queue = self.waiting.pop(owner)
+                        queue.popleft()
+                        if len(queue) > 0:
+                            self.waiting[owner] = queue
+                        self.condition.notify_all()
+                        return
+                    timeout = (needed - self.tokens) / self.get_rate()
+                self.condition.wait(timeout)
+
+
+class HostRateLimit():
+    def __init__(self, bytes_per_sec: float = 0, requests_per_sec: float = 0, min_scale: float = 0.05, max_backoff: float = 300) -> None:
+        self.bytes: FairTokenBucket = FairTokenBucket(bytes_per_sec)
+        self.requests: FairTokenBucket = FairTokenBucket(requests_per_sec)
+        self.min_scale: float = min_scale
+        self.max_backoff: float = max_backoff
+        self.backoff: float = 0
+        self.backoff_until: float = 0
+        self.recent_requests: deque = deque(maxlen=32)
+        self.lock: Lock = Lock()
+
+    def record_request(self) -> None:
+        with self.lock:
+            self.recent_requests.append(monotonic())
+
+    def get_recent_rate(self) -> Union[float, None]:
+        if len(self.recent_requests) < 2:
+            return None
+        # Measure over at least a second, so a short burst does not look like a huge sustained rate
+        span = max(1.0, self.recent_requests[-1] - self.recent_requests[0])
+        return (len(self.recent_requests) - 1) / span
+
+    def wait_for_backoff(self) -> None:
+        while True:
+            with self.lock:
+                remaining = self.backoff_until - monotonic()
+            if remaining <= 0:
+                return
+            sleep(remaining)
+
+    def on_throttled(self, retry_after: Union[float, None]) -> float:
+        with self.lock:
+            self.backoff = min(self.max_backoff, max(self.backoff * 2, 1))
+            delay = min(self.max_backoff, retry_after) if retry_after is not None else self.backoff
+            self.backoff_until = max(self.backoff_until, monotonic() + delay)
+            recent_rate = self.get_recent_rate()
+            if self.requests.rate <= 0 and recent_rate is not None:
+                # No configured limit to scale down, so start from the rate that got us throttled
+                self.requests.set_rate(recent_rate)
+            self.requests.scale = max(self.min_scale, self.requests.scale / 2)
+            return delay
+
+    def on_success(self) -> None:
+        with self.lock:
+            self.backoff = self.backoff / 2 if self.backoff >= 1 else 0
+            self.requests.scale = min(1.0, self.requests.scale + 0.05)
+
+
+class RateLimiter():
+    def __init__(self, bytes_per_sec: float = 0, requests_per_sec: float = 0, global_bytes_per_sec: float = 0, hosts: Union[dict, None] = None, max_retries: int = 5) -> None:
+        self.bytes_per_sec: float = bytes_per_sec
+        self.requests_per_sec: float = requests_per_sec
+        self.host_configs: dict = hosts if hosts is not None else {}
+        self.max_retries: int = max_retries
+        self.global_bytes: FairTokenBucket = FairTokenBucket(global_bytes_per_sec)
+        self.hosts: dict = {}
+        self.lock: Lock = Lock()
+        self.local = thread_local()
+
+    def get_host(self, host: str) -> HostRateLimit:
+        with self.lock:
+            limit = self.hosts.get(host)
+            if limit is None:
+                config = self.host_configs.get(host, {})
+                limit = HostRateLimit(config.get("bytes_per_sec", self.bytes_per_sec), config.get("requests_per_sec", self.requests_per_sec))
+                self.hosts[host] = limit
+            return limit
+
+    def get_owner(self) -> str:
+        return getattr(self.local, "owner", None) or current_thread().name
+
+    @contextmanager
+    def owner(self, name: str):
+        old_owner = getattr(self.local, "owner", None)
+        self.local.owner = name
+        try:
+            yield
+        finally:
+            self.local.owner = old_owner
+
+    def acquire_request(self, host: str, owner: str) -> None:
+        limit = self.get_host(host)
+        limit.wait_for_backoff()
+        limit.requests.acquire(1, owner)
+        limit.record_request()
+
+    def acquire_bytes(self, host: str, owner: str, amount: int) -> None:
+        self.get_host(host).bytes.acquire(amount, owner)
+        self.global_bytes.acquire(amount, owner)
+
+    @staticmethod
+    def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def from_dict(data: dict):
+        return RateLimiter(data.get("bytes_per_sec", 0), data.get("requests_per_sec", 0), data.get("global_bytes_per_sec", 0), data.get("hosts", {}), data.get("max_retries", 5))
+
+
+class ThrottledRaw():
+    wrapper_attrs: tuple = ("raw", "limiter", "host", "owner")
+
+    def __init__(self, raw, limiter: RateLimiter, host: str, owner: str) -> None:
+        self.raw = raw
+        self.limiter: RateLimiter = limiter
+        self.host: str = host
+        self.owner: str = owner
+
+    def stream(self, amt: int = 2**16, decode_content: Union[bool, None] = None):
+        for chunk in self.raw.stream(amt, decode_content=decode_content):
+            self.limiter.acquire_bytes(self.host, self.owner, len(chunk))
+            yield chunk
+
+    def read(self, *args, **kwargs):
+        data = self.raw.read(*args, **kwargs)
+        if data:
+            self.limiter.acquire_bytes(self.host, self.owner, len(data))
+        return data
+
+    def __getattr__(self, name: str):
+        return getattr(self.raw, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        # Flags like decode_content have to reach the real response, not just the wrapper
+        if name in self.wrapper_attrs:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.raw, name, value)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        limiter = rate_limiter
+        if limiter is None:
+            return super().send(request, **kwargs)
+        host = urlparse(request.url).hostname or ""
+        owner = limiter.get_owner()
+        for attempt in range(limiter.max_retries+1):
+            limiter.acquire_request(host, owner)
+            response = super().send(request, **kwargs)
+            if response.status_code != 429 or attempt >= limiter.max_retries:
+                break
+            delay = limiter.get_host(host).on_throttled(limiter.parse_retry_after(response.headers.get("Retry-After")))
+            logger.warning(f"Rate limited by {host}, backing off for {delay:.1f}s (attempt {attempt+1}/{limiter.max_retries})")
+            response.close()
+        if response.status_code != 429:
+            limiter.get_host(host).on_success()
+        response.raw = ThrottledRaw(response.raw, limiter, host, owner)
+        return response
+
+
+global rate_limiter
+rate_limiter: Union[RateLimiter, None] = None
+
+def install_rate_limiter(limiter: RateLimiter) -> None:
+    # Every requests.Session, including the ones minecraft_launcher_lib creates, mounts this adapter
+    global rate_limiter
+    rate_limiter = limiter
+    requests.sessions.HTTPAdapter = RateLimitedAdapter
+
+def rate_limit_owner(name: str):
+    if rate_limiter is None:
+        return nullcontext()
+    return rate_limiter.owner(name)
+
+
+def get_jar_segments(jarpath: str) -> list[dict]:
+    # Each entry is split into its local header and its compressed data. Headers hold timestamps that
+    # change on every build, so only data segments are worth reusing; everything else is "other".
+    data_ranges = {}
+    with zipfile.ZipFile(jarpath, "r") as jar, open(jarpath, "rb") as f:
+        boundaries = {0, jar.start_dir}
+        for info in jar.infolist():
+            f.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", f.read(4))
+            data_offset = info.header_offset + 30 + name_length + extra_length
+            data_ranges[data_offset] = info
+            boundaries.update((info.header_offset, data_offset, data_offset + info.compress_size))
+    boundaries.add(os.path.getsize(jarpath))
+    boundaries = sorted(boundaries)
+    segments = []
+    with open(jarpath, "rb") as f:
+        for offset, next_offset in zip(boundaries, boundaries[1:]):
+            f.seek(offset)
+            segment = {"offset": offset, "size": next_offset - offset, "sha1": hashlib.sha1(f.read(next_offset - offset)).hexdigest(), "kind": "other"}
+            info = data_ranges.get(offset)
+            if info is not None and info.compress_size == segment["size"]:
+                segment.update({"kind": "data", "crc": info.CRC, "compress_size": info.compress_size})
+            segments.append(segment)
+    return segments
+
+def get_segment_key(segment: dict) -> Union[tuple, None]:
+    if segment.get("kind") != "data":
+        return None
+    return (segment["crc"], segment["compress_size"], segment["sha1"])
+
+def get_jar_manifest(jarpath: str) -> dict:
+    with open(jarpath, "rb") as f:
+        sha1 = hashlib.sha1(f.read()).hexdigest()
+    return {
+            "filename": os.path.basename(jarpath),
+            "sha1": sha1,
+            "segments": get_jar_segments(jarpath),
+            }
+
+def read_segment(f, segment: dict) -> bytes:
+    f.seek(segment["offset"])
+    return f.read(segment["size"])
+
+def rebuild_jar(manifest: dict, old_jarpath: str, fetch_segments: Callable[[list[int]], bytes], new_jarpath: str, sha1: str) -> bool:
+    old_segments = {}
+    for segment in get_jar_segments(old_jarpath):
+        key = get_segment_key(segment)
+        if key is not None:
+            old_segments[key] = segment
+    # Headers and the central directory are small and always fetched, compressed data is reused when it matches
+    missing = [i for i, segment in enumerate(manifest["segments"]) if get_segment_key(segment) not in old_segments]
+    fetched = {}
+    if len(missing) > 0:
+        data = fetch_segments(missing)
+        offset = 0
+        for i in missing:
+            size = manifest["segments"][i]["size"]
+            fetched[i] = data[offset:offset+size]
+            offset += size
+    file_hash = hashlib.sha1()
+    tmppath = new_jarpath + ".part"
+    try:
+        with open(old_jarpath, "rb") as old_jar, open(tmppath, "wb") as new_jar:
+            for i, segment in enumerate(manifest["segments"]):
+                data = fetched[i] if i in fetched else read_segment(old_jar, old_segments[get_segment_key(segment)])
+                if hashlib.sha1(data).hexdigest() != segment["sha1"]:
+                    logger.warning(f"Segment {i} of {new_jarpath} does not match the manifest")
+                    return False
+                file_hash.update(data)
+                new_jar.write(data)
+        # The expected hash comes from CurseForge, not the mirror, so a stale or wrong mirror jar is rejected
+        if file_hash.hexdigest() != sha1:
+            logger.warning(f"Rebuilt jar {new_jarpath} does not match the CurseForge sha1 {sha1}")
+            return False
+        os.replace(tmppath, new_jarpath)
+        return True
+    finally:
+        if os.path.isfile(tmppath):
+            os.remove(tmppath)
+
+
+class DeltaMirrorHandler(BaseHTTPRequestHandler):
+    # Serves ROOT/PROJECT_ID/FILE_ID/*.jar as segment manifests and segment bytes
+    root: str = "."
+    manifests: dict = {}
+    manifests_lock = Lock()
+
+    def find_jar(self) -> Union[str, None]:
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 3 or not parts[0].isdigit() or not parts[1].isdigit():
+            return None
+        filedir = os.path.join(self.root, parts[0], parts[1])
+        if os.path.isdir(filedir):
+            for filename in sorted(os.listdir(filedir)):
+                if filename.endswith(".jar"):
+                    return os.path.join(filedir, filename)
+        return None
+
+    def get_manifest(self, jarpath: str) -> dict:
+        with self.manifests_lock:
+            manifest = self.manifests.get(jarpath)
+            if manifest is None:
+                manifest = get_jar_manifest(jarpath)
+                self.manifests[jarpath] = manifest
+            return manifest
+
+    def send_data(self, data: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        jarpath = self.find_jar()
+        if jarpath is None or not self.path.endswith("/manifest.json"):
+            self.send_error(404)
+            return
+        self.send_data(jdumps(self.get_manifest(jarpath)).encode("utf-8"), "application/json")
+
+    def do_POST(self) -> None:
+        jarpath = self.find_jar()
+        if jarpath is None or not self.path.endswith("/segments"):
+            self.send_error(404)
+            return
+        segments = self.get_manifest(jarpath)["segments"]
+        try:
+            indexes = jloads(self.rfile.read(int(self.headers.get("Content-Length", 0)))).get("indexes", [])
+            if not all(isinstance(i, int) and 0 <= i < len(segments) for i in indexes):
+                raise ValueError(indexes)
+        except Exception:
+            self.send_error(400)
+            return
+        with open(jarpath, "rb") as f:
+            self.send_data(b"".join(read_segment(f, segments[i]) for i in indexes), "application/octet-stream")
+
+    def log_message(self, format: str, *args) -> None:
+        logger.info(f"Delta mirror: {self.address_string()} {format % args}")
+
+
+def serve_delta_mirror(root: str, port: int, host: str = "") -> None:
+    handler = type("RootedDeltaMirrorHandler", (DeltaMirrorHandler,), {"root": expand_full_path(root), "manifests": {}})
+    server = ThreadingHTTPServer((host, port), handler)
+    msg = f"Serving mod jar deltas from {handler.root} on port {server.server_address[1]}..."
+    logger.info(msg)
+    print(msg)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+class ModsState():
+    state_filename: str = ".creepyr_mods.json"
+
+    def __init__(self, mods_dir: str) -> None:
+        self.mods_dir: str = mods_dir
+        self.mods: dict = {}
+        self.lock: Lock = Lock()
+
+    def get_state_path(self) -> str:
+        return os.path.join(self.mods_dir, self.state_filename)
+
+    def load(self) -> bool:
+        jfilepath = self.get_state_path()
+        if os.path.isfile(jfilepath):
+            try:
+                with open(jfilepath, "r") as f:
+                    mods = jloads(f.read())
+                with self.lock:
+                    self.mods = mods
+                return True
+            except Exception as e:
+                logger.warning(f"Could not load mods state from file {jfilepath}: {e}")
+        return False
+
+    def save(self) -> bool:
+        jfilepath = self.get_state_path()
+        try:
+            os.makedirs(self.mods_dir, exist_ok=True)
+            with self.lock:
+                data = jdumps(self.mods, indent=4)
+            # Write to a temporary file first so readers never see a half-written state file
+            fd, tmppath = tempfile.mkstemp(prefix=self.state_filename + ".", suffix=".tmp", dir=self.mods_dir)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmppath, jfilepath)
+            finally:
+                if os.path.isfile(tmppath):
+                    os.remove(tmppath)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save mods state to file {jfilepath}: {e}")
+            return False
+
+    def get(self, jmod: dict) -> Union[dict, None]:
+        with self.lock:
+            return self.mods.get(str(jmod.get("projectID", "")))
+
+    def set(self, jmod: dict, modfilename: str) -> None:
+        with self.lock:
+            self.mods[str(jmod.get("projectID", ""))] = {"fileID": jmod.get("fileID", ""), "filename": modfilename}
+
+    @staticmethod
+    def open(mods_dir: str):
+        state = ModsState(mods_dir)
+        state.load()
+        return state
+
+
 class Account():
+    __slots__ = ("name", "username", "mcuuid", "mctoken")
+
+    record_fields: dict = {
+            "name": (str, ""),
+            "username": (str, ""),
+            "mcuuid": (str, ""),
+            "mctoken": (str, ""),
+            }
+
     def __init__(self, name: str = "fake", username: str = "fake", mcuuid: str = "", mctoken: str = "") -> None:
         self.name = name
         self.username = username
@@ -92,6 +919,18 @@ class Account():
     def from_dict(data: dict):
         return Account(data.get("name", ""), data.get("username", ""), data.get("mcuuid", ""), data.get("mctoken", ""))
 
+    @staticmethod
+    def to_dicts(accounts: list) -> list[dict]:
+        return [account.to_dict() for account in accounts]
+
+    @staticmethod
+    def from_dicts(data: list[dict]) -> list:
+        accounts = []
+        for adata in data:
+            record = validate_record(adata, Account.record_fields, "account")
+            accounts.append(Account(record["name"], record["username"], record["mcuuid"], record["mctoken"]))
+        return accounts
+
     def __str__(self) -> str:
         return str(self.to_dict())
 
@@ -113,9 +952,28 @@ class Account():
 
 
 class Instance():
-    current_install_max: int = 0
-
-    def __init__(self, name: str = "minecraft", mcdir: str = minecraft_launcher_lib.utils.get_minecraft_directory(), mcversion: str =  "", mctype: str = "vanilla", mlversion: str = "", jvmexec: str = "", jvmargs: list[str] = [], verify_mcversion: bool = True, verify_mlversion: bool = True, verify_launch_version: bool = True, cf_manifest_path: Union[str, None] = None, mr_manifest_path: Union[str, None] = None, creepyr_manifest_path: Union[str, None] = None) -> None:
+    __slots__ = ("name", "mcdir", "mcversion", "mctype", "mlversion", "jvmexec", "jvmargs", "verify_mcversion", "verify_mlversion", "verify_launch_version", "cf_manifest_path", "mr_manifest_path", "creepyr_manifest_path", "current_install_max")
+
+    mctypes: tuple = ("vanilla", "forge", "fabric")
+
+    record_fields: dict = {
+            "name": (str, ""),
+            "mcdir": (str, ""),
+            "mcversion": (str, ""),
+            "mctype": (str, ""),
+            "mlversion": (str, ""),
+            "jvmexec": (str, ""),
+            "jvmargs": ((list, tuple, str), ()),
+            "verify_mcversion": (bool, True),
+            "verify_mlversion": (bool, True),
+            "verify_launch_version": (bool, True),
+            "cf_manifest_path": ((str, type(None)), None),
+            "mr_manifest_path": ((str, type(None)), None),
+            "creepyr_manifest_path": ((str, type(None)), None),
+            }
+
+    def __init__(self, name: str = "minecraft", mcdir: str = minecraft_launcher_lib.utils.get_minecraft_directory(), mcversion: str =  "", mctype: str = "vanilla", mlversion: str = "", jvmexec: str = "", jvmargs: Sequence[str] = (), verify_mcversion: bool = True, verify_mlversion: bool = True, verify_launch_version: bool = True, cf_manifest_path: Union[str, None] = None, mr_manifest_path: Union[str, None] = None, creepyr_manifest_path: Union[str, None] = None) -> None:
+        self.current_install_max: int = 0
         self.verify_mcversion: bool = verify_mcversion
         self.verify_mlversion: bool = verify_mlversion
         self.verify_launch_version: bool = verify_launch_version
@@ -138,14 +996,8 @@ class Instance():
                 logger.warning(f"Could not connect to the internet while trying to verify Forge version: {mlversion}    ; Proceeding under the assumption it is correct!")
         else:
             mcversion = mcversion
-        if mcversion == "":
-            self.mcversion: str = "Invalid"
-        else:
-            self.mcversion: str = mcversion
-        if mctype in ("vanilla", "forge", "fabric"):
-            self.mctype: str = mctype
-        else:
-            self.mctype: str = "Invalid"
+        self.mcversion: str = self.normalize_version(mcversion)
+        self.mctype: str = self.normalize_mctype(mctype)
         if mlversion == "":
             if mctype == "forge":
                 if has_network_access():
@@ -182,16 +1034,21 @@ class Instance():
                     mlversion = mlversion
         else:
             mlversion = mlversion
-        if mlversion == "":
-            self.mlversion: str = "Invalid"
-        else:
-            self.mlversion: str = mlversion
+        self.mlversion: str = self.normalize_version(mlversion)
         self.jvmexec: str = jvmexec
-        self.jvmargs: list[str] = jvmargs
+        self.jvmargs: list[str] = split_jvmargs(jvmargs)
         self.cf_manifest_path: Union[str, None] = cf_manifest_path
         self.mr_manifest_path: Union[str, None] = mr_manifest_path
         self.creepyr_manifest_path: Union[str, None] = creepyr_manifest_path
 
+    @staticmethod
+    def normalize_version(version: str) -> str:
+        return version if version != "" else "Invalid"
+
+    @staticmethod
+    def normalize_mctype(mctype: str) -> str:
+        return mctype if mctype in Instance.mctypes else "Invalid"
+
     def get_mcdir_path(self):
         return expand_full_path(self.mcdir)
 
@@ -201,12 +1058,11 @@ class Instance():
     def install_mc(self) -> bool:
         if has_network_access():
             try:
-                if self.mctype == "forge":
-                    minecraft_launcher_lib.forge.install_forge_version(self.mlversion, self.get_mcdir_path(), callback=self.get_install_callbacks())
-                elif self.mctype == "fabric":
-                    minecraft_launcher_lib.fabric.install_fabric(self.mcversion, self.get_mcdir_path(), callback=self.get_install_callbacks())
-                else:
-                    minecraft_launcher_lib.install.install_minecraft_version(self.mcversion, self.get_mcdir_path(), callback=self.get_install_callbacks())
+                with rate_limit_owner(self.name):
+                    self.install_mc_version()
+                index = VersionIndex(self.get_mcdir_path())
+                index.load()
+                index.rebuild()
                 return True
             except Exception as e:
                 logger.warning(e)
@@ -215,6 +1071,14 @@ class Instance():
             logger.warning(f"Could not connect to the internet while trying to verify Minecraft version: {self.mcversion}    , of type: {self.mctype}{'' if self.mctype == 'vanilla' else '    , and of loader version: ' + self.mlversion}    ; Exiting with code 1!")
             return False
 
+    def install_mc_version(self) -> None:
+        if self.mctype == "forge":
+            minecraft_launcher_lib.forge.install_forge_version(self.mlversion, self.get_mcdir_path(), callback=self.get_install_callbacks())
+        elif self.mctype == "fabric":
+            minecraft_launcher_lib.fabric.install_fabric(self.mcversion, self.get_mcdir_path(), callback=self.get_install_callbacks())
+        else:
+            minecraft_launcher_lib.install.install_minecraft_version(self.mcversion, self.get_mcdir_path(), callback=self.get_install_callbacks())
+
     def set_install_status(self, status: str):
         logger.info(status)
         print(status)
@@ -238,7 +1102,87 @@ class Instance():
     def install_mod_mr(self, jmod: dict, ithread: Union[int, None] = None, imod: Union[int, None] = None, ithreads: Union[int, None] = None, imods: Union[int, None] = None, total_imods: Union[int, None] = None) -> bool:
         return True
 
-    def install_mod_cf(self, jmod: dict, api_key: str, ithread: Union[int, None] = None, imod: Union[int, None] = None, ithreads: Union[int, None] = None, imods: Union[int, None] = None, total_imods: Union[int, None] = None) -> bool:
+    def get_mods_dir_path(self) -> str:
+        return expand_full_path(os.path.join(self.get_mcdir_path(), "mods"))
+
+    def get_mods_state(self) -> ModsState:
+        return ModsState.open(self.get_mods_dir_path())
+
+    def get_mod_cf_sha1(self, jmod: dict, api_key: str) -> Union[str, None]:
+        data = requests.get(f"https://api.curseforge.com/v1/mods/{jmod.get('projectID', '')}/files/{jmod.get('fileID', '')}", headers = {
+            "Accept": "application/json",
+            "x-api-key": api_key,}, timeout=60).json().get("data", {})
+        for filehash in data.get("hashes", []):
+            if filehash.get("algo") == 1: # CurseForge's id for sha1
+                return filehash.get("value")
+        return None
+
+    def install_mod_cf_delta(self, jmod: dict, api_key: str, mirror_url: str, mods_state: ModsState, iprefix: str = "") -> bool:
+        old_state = mods_state.get(jmod)
+        if old_state is None or str(old_state.get("fileID")) == str(jmod.get("fileID", "")):
+            return False
+        old_modfilepath = os.path.join(self.get_mods_dir_path(), old_state.get("filename", ""))
+        if not os.path.isfile(old_modfilepath):
+            return False
+        fileurl = f"{mirror_url.rstrip('/')}/{jmod.get('projectID', '')}/{jmod.get('fileID', '')}"
+        try:
+            sha1 = self.get_mod_cf_sha1(jmod, api_key)
+            if sha1 is None:
+                logger.warning(f"{iprefix}CurseForge has no sha1 for mod {jmod}, falling back to a full download")
+                return False
+            manifest = requests.get(f"{fileurl}/manifest.json", timeout=60).json()
+            if manifest.get("sha1") != sha1:
+                logger.warning(f"{iprefix}Mirror {mirror_url} has a different jar than CurseForge for mod {jmod}, falling back to a full download")
+                return False
+            modfilename = os.path.basename(manifest["filename"])
+            modfilepath = os.path.join(self.get_mods_dir_path(), modfilename)
+            msg = f"{iprefix}Patching {old_state.get('filename')} into {modfilename} from mirror: {mirror_url}..."
+            logger.info(msg)
+            print(msg)
+
+            def fetch_segments(indexes: list[int]) -> bytes:
+                fetch_size = sum(manifest["segments"][i]["size"] for i in indexes)
+                total_size = sum(segment["size"] for segment in manifest["segments"])
+                msg = f"{iprefix}Fetching {len(indexes)}/{len(manifest['segments'])} segments ({fetch_size}/{total_size} bytes) of {modfilename}..."
+                logger.info(msg)
+                print(msg)
+                delta = requests.post(f"{fileurl}/segments", json={"indexes": indexes}, timeout=60*3)
+                delta.raise_for_status()
+                return delta.content
+
+            if not rebuild_jar(manifest, old_modfilepath, fetch_segments, modfilepath, sha1):
+                return False
+        except Exception as e:
+            logger.warning(f"{iprefix}Could not patch mod {jmod} from mirror {mirror_url}, falling back to a full download: {e}")
+            return False
+        self.remove_replaced_mod(old_state, modfilename)
+        mods_state.set(jmod, modfilename)
+        return True
+
+    def remove_replaced_mod(self, old_state: Union[dict, None], modfilename: str) -> None:
+        if old_state is None or old_state.get("filename", "") in ("", modfilename):
+            return
+        old_modfilepath = os.path.join(self.get_mods_dir_path(), old_state["filename"])
+        if os.path.isfile(old_modfilepath):
+            msg = f"Removing replaced mod file {old_modfilepath}..."
+            logger.info(msg)
+            print(msg)
+            os.remove(old_modfilepath)
+
+    def install_mod_cf(self, jmod: dict, api_key: str, ithread: Union[int, None] = None, imod: Union[int, None] = None, ithreads: Union[int, None] = None, imods: Union[int, None] = None, total_imods: Union[int, None] = None, mods_state: Union[ModsState, None] = None) -> bool:
+        save_state = mods_state is None
+        if mods_state is None:
+            mods_state = self.get_mods_state()
+        if ithread is not None and ithread is not None:
+            iprefix = f"[ Thread {ithread}/{ithreads} ]: "
+        else:
+            iprefix = ""
+        if imod is not None and imods is not None:
+            iprefix += f"[ Mod {imod}/{imods}{', In Total '+ str(total_imods) if total_imods is not None else ''} ]: "
+        if delta_mirror_url is not None and self.install_mod_cf_delta(jmod, api_key, delta_mirror_url, mods_state, iprefix):
+            if save_state:
+                mods_state.save()
+            return True
         try:
             modurl = requests.get(f"https://api.curseforge.com/v1/mods/{jmod.get('projectID', '')}/files/{jmod.get('fileID', '')}/download-url", headers = {
                 "Accept": "application/json",
@@ -251,12 +1195,6 @@ class Instance():
                 moddl = requests.get(modurl, stream=True, timeout=60*3)
                 modfilename = modurl.split("/")[-1]
                 modfilepath = expand_full_path(os.path.join(self.get_mcdir_path(), "mods", modfilename))
-                if ithread is not None and ithread is not None:
-                    iprefix = f"[ Thread {ithread}/{ithreads} ]: "
-                else:
-                    iprefix = ""
-                if imod is not None and imods is not None:
-                    iprefix += f"[ Mod {imod}/{imods}{', In Total '+ str(total_imods) if total_imods is not None else ''} ]: "
                 if os.path.isfile(modfilepath):
                     msg = f"{iprefix}File {modfilepath} already exists, skipping..."
                     logger.info(msg)
@@ -275,15 +1213,21 @@ class Instance():
                                 logger.info(msg)
                                 print(msg)
                                 modfile.write(ch)
+                self.remove_replaced_mod(mods_state.get(jmod), modfilename)
+                mods_state.set(jmod, modfilename)
             except Exception as e:
                 logger.warning(f"Encountered exception while downloading mod: {jmod}: ", e)
+        if save_state:
+            mods_state.save()
         return True
 
-    def _sub_install_mods_cf(self, api_key: str, modslist: list, ithread: int, ithreads: int, total_imods: int) -> bool:
+    def _sub_install_mods_cf(self, api_key: str, modslist: list, ithread: int, ithreads: int, total_imods: int, mods_state: ModsState) -> bool:
         ret = True
-        for imod, jmod in enumerate(modslist):
-            if not self.install_mod_cf(jmod, api_key, ithread, imod+1, ithreads, len(modslist), total_imods):
-                ret = False
+        with rate_limit_owner(self.name):
+            for imod, jmod in enumerate(modslist):
+                if not self.install_mod_cf(jmod, api_key, ithread, imod+1, ithreads, len(modslist), total_imods, mods_state):
+                    ret = False
+        mods_state.save()
         return ret
 
     def install_mods_cf(self, api_key: str, threads: int = 10) -> bool:
@@ -293,11 +1237,12 @@ class Instance():
                 with open(jfilepath, "r") as f:
                     manifest_data = jloads(f.read())
                     modslist = manifest_data.get("files", [])
+                    mods_state = self.get_mods_state()
                     thread_size = max(int(len(modslist) / threads), 1)
                     last_ithread = 0
                     for ithread in range(1, threads+1):
                         next_ithread = last_ithread+thread_size
-                        Thread(target=self._sub_install_mods_cf, args=[api_key, modslist[last_ithread:(None if ithread >= threads else next_ithread)], ithread, threads, len(modslist)]).start()
+                        Thread(target=self._sub_install_mods_cf, args=[api_key, modslist[last_ithread:(None if ithread >= threads else next_ithread)], ithread, threads, len(modslist), mods_state]).start()
                         if next_ithread >= len(modslist):
                             break
                         last_ithread = next_ithread
@@ -361,7 +1306,27 @@ class Instance():
         else:
             return self.update_ml(save, jfilepath)
 
-    def get_launch_cmd(self, account: Account, jvmexec: str = "", jvmargs: list[str] = [], verify_launch_version: Union[bool, None] = None) -> Union[list[str], int]:
+    def get_version_index(self) -> VersionIndex:
+        return VersionIndex.open(self.get_mcdir_path())
+
+    def get_launch_version(self) -> str:
+        if self.mctype == "vanilla":
+            return self.mcversion
+        elif self.mctype == "forge":
+            return minecraft_launcher_lib.forge.forge_to_installed_version(self.mlversion)
+        else:
+            return f"{self.mcversion}-{self.mctype}-{self.mlversion}" # This should handle Fabric
+
+    def is_launch_version_installed(self, version: str, index: Union[VersionIndex, None] = None) -> bool:
+        if index is None:
+            index = self.get_version_index()
+        if index.is_launchable(version):
+            return True
+        # The index can miss versions installed by other launchers, so rescan once before giving up
+        index.rebuild()
+        return index.is_launchable(version)
+
+    def get_launch_cmd(self, account: Account, jvmexec: str = "", jvmargs: Sequence[str] = (), verify_launch_version: Union[bool, None] = None, index: Union[VersionIndex, None] = None) -> Union[list[str], int]:
         if verify_launch_version is None:
             verify_launch_version = self.verify_launch_version
         options = account.to_options()
@@ -369,36 +1334,32 @@ class Instance():
             jvmexec = self.get_jvmexec_path()
         options["executablePath"] = expand_full_path(jvmexec)
         if len(jvmargs) > 0:
-            options["jvmArguments"] = jvmargs
-        if self.mctype == "vanilla":
-            version = self.mcversion
-        elif self.mctype == "forge":
-            version = minecraft_launcher_lib.forge.forge_to_installed_version(self.mlversion)
-        else:
-            version = f"{self.mcversion}-{self.mctype}-{self.mlversion}" # This should handle Fabric
-        vn_valid = not verify_launch_version
-        if not vn_valid:
-            for vn in minecraft_launcher_lib.utils.get_installed_versions(self.get_mcdir_path()):
-                if version == vn["id"]:
-                    vn_valid = True
-                    break
-        if vn_valid:
+            options["jvmArguments"] = list(jvmargs)
+        version = self.get_launch_version()
+        if not verify_launch_version or self.is_launch_version_installed(version, index):
             return minecraft_launcher_lib.command.get_minecraft_command(version, self.get_mcdir_path(), options)
         else:
             logger.error(f"Failed to launch Minecraft of type: {self.mctype}    and of version: {version}    because that version is not installed! Exiting with code -1.")
             return -1
 
-    def launch(self, account: Account, jvmexec: str = "", jvmargs: list[str] = [], verify_launch_version: Union[bool, None] = None) -> int:
+    def get_log_pipeline(self) -> LogPipeline:
+        return LogPipeline(self.name, os.path.join(self.get_mcdir_path(), "logs", "creepyr"))
+
+    def launch(self, account: Account, jvmexec: str = "", jvmargs: Sequence[str] = (), verify_launch_version: Union[bool, None] = None, log_pipeline: Union[LogPipeline, None] = None) -> int:
         if verify_launch_version is None:
             verify_launch_version = self.verify_launch_version
-        if len(minecraft_launcher_lib.utils.get_installed_versions(self.get_mcdir_path())) == 0:
+        index = self.get_version_index()
+        if not index.has_versions():
             if not self.install_mc():
                 return 1
+            index = self.get_version_index()
         if jvmexec == "":
             jvmexec = self.get_jvmexec_path()
-        launch_cmd = self.get_launch_cmd(account, jvmexec, jvmargs, verify_launch_version)
+        launch_cmd = self.get_launch_cmd(account, jvmexec, jvmargs, verify_launch_version, index)
         if isinstance(launch_cmd, list):
-            return subprocess.call(launch_cmd, cwd=self.get_mcdir_path())
+            if log_pipeline is None:
+                log_pipeline = self.get_log_pipeline()
+            return log_pipeline.run(launch_cmd, cwd=self.get_mcdir_path())
         return launch_cmd
 
     def to_dict(self) -> dict:
@@ -409,7 +1370,7 @@ class Instance():
                 "mctype": self.mctype,
                 "mlversion": self.mlversion,
                 "jvmexec": self.jvmexec,
-                "jvmargs": self.jvmargs,
+                "jvmargs": list(self.jvmargs),
                 "verify_mcversion": self.verify_mcversion,
                 "verify_mlversion": self.verify_mlversion,
                 "verify_launch_version": self.verify_launch_version,
@@ -422,6 +1383,35 @@ class Instance():
     def from_dict(data: dict):
         return Instance(data.get("name", ""), data.get("mcdir", ""), data.get("mcversion", ""), data.get("mctype", ""), data.get("mlversion", ""), data.get("jvmexec", ""), data.get("jvmargs", ""), data.get("verify_mcversion", True), data.get("verify_mlversion", True), data.get("verify_launch_version", True), data.get("cf_manifest_path", None), data.get("mr_manifest_path", None), data.get("creepyr_manifest_path", None))
 
+    @staticmethod
+    def from_record(data: dict):
+        # Bulk loading trusts previously saved versions instead of re-verifying each one over the network
+        record = validate_record(data, Instance.record_fields, "instance")
+        instance = Instance.__new__(Instance)
+        instance.current_install_max = 0
+        instance.name = record["name"]
+        instance.mcdir = record["mcdir"]
+        instance.mcversion = Instance.normalize_version(record["mcversion"])
+        instance.mctype = Instance.normalize_mctype(record["mctype"])
+        instance.mlversion = Instance.normalize_version(record["mlversion"])
+        instance.jvmexec = record["jvmexec"]
+        instance.jvmargs = split_jvmargs(record["jvmargs"])
+        instance.verify_mcversion = record["verify_mcversion"]
+        instance.verify_mlversion = record["verify_mlversion"]
+        instance.verify_launch_version = record["verify_launch_version"]
+        instance.cf_manifest_path = record["cf_manifest_path"]
+        instance.mr_manifest_path = record["mr_manifest_path"]
+        instance.creepyr_manifest_path = record["creepyr_manifest_path"]
+        return instance
+
+    @staticmethod
+    def to_dicts(instances: list) -> list[dict]:
+        return [instance.to_dict() for instance in instances]
+
+    @staticmethod
+    def from_dicts(data: list[dict]) -> list:
+        return [Instance.from_record(idata) for idata in data]
+
     def save_to_file(self, jfilepath: Union[str, None] = None) -> bool:
         if jfilepath is None:
             jfilepath = self.creepyr_manifest_path
@@ -459,6 +1449,29 @@ def main(args: list[str]) -> int:
     ```
 
 
+    ```
+    # Limit download bandwidth and request rates, prepend to any command
+    python3 creepyr.py ratelimit=LIMITS_JSON_FILE ...
+    # LIMITS_JSON_FILE is a path to a JSON file like:
+    # {"global_bytes_per_sec": 5000000, "bytes_per_sec": 2000000, "requests_per_sec": 20,
+    #  "hosts": {"api.curseforge.com": {"requests_per_sec": 5}}}
+    ```
+
+
+    ```
+    # Patch changed mod jars from a delta mirror instead of downloading them in full, prepend to any command
+    # Patched jars are checked against the sha1 from CurseForge, so cfapikey= is needed too
+    python3 creepyr.py deltamirror=http://MIRROR_HOST:PORT cfapikey=CURSEFORGE_API_KEY ...
+    ```
+
+
+    ```
+    # Serve mod jar deltas to other instances, from a directory laid out as MIRROR_DIR/PROJECT_ID/FILE_ID/MOD.jar
+    # The jars must be the unmodified CurseForge downloads
+    python3 creepyr.py mirror MIRROR_DIR PORT
+    ```
+
+
     ```
     # Print this help message
     python3 creepyr.py help
@@ -468,11 +1481,28 @@ def main(args: list[str]) -> int:
     See https://github.com/Dunkmania101/Creepyr for more
     """
     arg_cfapikey = "cfapikey="
-    for arg in args:
+    arg_ratelimit = "ratelimit="
+    arg_deltamirror = "deltamirror="
+    # No limits by default, but 429 responses are still backed off from
+    install_rate_limiter(RateLimiter())
+    for arg in args[:]:
         if arg.startswith(arg_cfapikey):
             global cf_api_key
             cf_api_key = arg.removeprefix(arg_cfapikey)
             args.remove(arg)
+        elif arg.startswith(arg_ratelimit):
+            jfilepath = expand_full_path(arg.removeprefix(arg_ratelimit))
+            try:
+                with open(jfilepath, "r") as f:
+                    install_rate_limiter(RateLimiter.from_dict(jloads(f.read())))
+            except Exception as e:
+                logger.error(f"Could not load rate limits from file {jfilepath}: {e}")
+                return 1
+            args.remove(arg)
+        elif arg.startswith(arg_deltamirror):
+            global delta_mirror_url
+            delta_mirror_url = arg.removeprefix(arg_deltamirror)
+            args.remove(arg)
     if args[1] == "instance":
         instanceargs = args[3:]
         instance = None
@@ -554,6 +1584,8 @@ def main(args: list[str]) -> int:
                         return_code = return_code if return_code != 0 else exit_code
                         logger.error(f"Game exited abnormally with code {exit_code}, exiting with code {return_code} (100+{exit_code})")
                         return return_code
+    elif args[1] == "mirror":
+        serve_delta_mirror(args[2], int(args[3]))
     elif args[1] == "account":
         accountargs = args[2:]
         account = None